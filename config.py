@@ -3,51 +3,86 @@ Configuration management with environment variables
 """
 
 import os
+from dataclasses import dataclass, fields
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 
+@dataclass(frozen=True)
 class Config:
-    """Application configuration"""
+    """Application configuration, built once from the environment"""
     
     # Application
-    FLASK_ENV = os.getenv('FLASK_ENV', 'development')
-    DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    DEBUG: bool = False
+    LOG_LEVEL: str = 'INFO'
     
     # Model
-    MODEL_PATH = os.getenv('MODEL_PATH', 'models/churn_model.pkl')
-    MODEL_VERSION = os.getenv('MODEL_VERSION', '1.0.0')
+    MODEL_PATH: str = 'models/churn_model.pkl'
+    MODEL_VERSION: str = '1.0.0'
+    # Numba tree walker for single-row predictions (needs numba installed)
+    USE_TREE_WALKER: bool = True
+    # ONNX export of the model for batched inference (empty disables it)
+    ONNX_MODEL_PATH: str = ''
     
     # API
-    API_VERSION = os.getenv('API_VERSION', 'v1')
-    HOST = os.getenv('HOST', '0.0.0.0')
-    PORT = int(os.getenv('PORT', 5000))
-    WORKERS = int(os.getenv('WORKERS', 4))
+    API_VERSION: str = 'v1'
+    HOST: str = '0.0.0.0'
+    PORT: int = 5000
+    # /health, /ready and /metrics live on their own port
+    PROBE_PORT: int = 5001
+    # Comma-separated browser origins allowed via CORS; empty disables CORS
+    ALLOWED_ORIGINS: tuple = ()
+    
+    # Batching
+    MAX_BATCH: int = 64
+    MAX_WAIT_MS: float = 5.0
+    BATCH_TIMEOUT: float = 5.0
+    PREDICT_CACHE_SIZE: int = 4096
     
     # Monitoring
-    ENABLE_METRICS = os.getenv('ENABLE_METRICS', 'True').lower() == 'true'
+    ENABLE_METRICS: bool = True
     
     # Data
-    N_CUSTOMERS = 10000
-    N_FEATURES = 25
+    N_CUSTOMERS: int = 10000
+    N_FEATURES: int = 25
     
     # Model Training
-    MAX_DEPTH = 6
-    LEARNING_RATE = 0.1
-    N_ESTIMATORS = 200
-    SUBSAMPLE = 0.8
-    COLSAMPLE_BYTREE = 0.8
+    MAX_DEPTH: int = 6
+    LEARNING_RATE: float = 0.1
+    N_ESTIMATORS: int = 200
+    SUBSAMPLE: float = 0.8
+    COLSAMPLE_BYTREE: float = 0.8
     
     # SMOTE
-    SMOTE_SAMPLING_STRATEGY = 0.8
-    SMOTE_K_NEIGHBORS = 5
+    SMOTE_SAMPLING_STRATEGY: float = 0.8
+    SMOTE_K_NEIGHBORS: int = 5
     
     # Training
-    TEST_SIZE = 0.2
-    RANDOM_STATE = 42
+    TEST_SIZE: float = 0.2
+    RANDOM_STATE: int = 42
+    
+    @classmethod
+    def from_env(cls, environ=os.environ):
+        """Build config from a single pass over the environment"""
+        types = {f.name: f.type for f in fields(cls)}
+        
+        values = {
+            name: _parse(value, types[name])
+            for name, value in environ.items()
+            if name in types
+        }
+        return cls(**values)
+
+
+def _parse(value, type_):
+    """Convert an environment string to the field's type"""
+    if type_ is bool:
+        return value.lower() == 'true'
+    if type_ is tuple:
+        return tuple(item.strip() for item in value.split(',') if item.strip())
+    return type_(value)
 
 
-config = Config()
+config = Config.from_env()
@@ -0,0 +1,48 @@
+"""
+Gunicorn configuration
+"""
+
+import os
+
+# One native thread per worker process; set before numpy/xgboost load
+for _var in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS', 'XGBOOST_NUM_THREADS'):
+    os.environ.setdefault(_var, '1')
+
+# Cores this container may use
+if hasattr(os, 'sched_getaffinity'):
+    CPUS = sorted(os.sched_getaffinity(0))
+else:
+    CPUS = list(range(os.cpu_count() or 1))
+
+# Server
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '5000')}"
+worker_class = 'uvicorn.workers.UvicornWorker'
+# Inference is compute-bound, so one worker per core ('auto')
+_workers = os.getenv('GUNICORN_WORKERS', 'auto')
+workers = len(CPUS) if _workers == 'auto' else int(_workers)
+timeout = 120
+
+# Load the model once in the master; workers share its pages copy-on-write
+preload_app = True
+
+# Recycle workers periodically to bound memory growth
+max_requests = 100000
+max_requests_jitter = 100
+
+# Logging
+accesslog = 'logs/access.log'
+errorlog = 'logs/error.log'
+disable_redirect_access_to_syslog = True
+
+
+def pre_fork(server, worker):
+    """Assign the new worker the least-used core (runs in the master)"""
+    in_use = [getattr(w, 'cpu_id', None) for w in server.WORKERS.values()]
+    worker.cpu_id = min(CPUS, key=in_use.count)
+
+
+def post_fork(server, worker):
+    """Pin the worker process to its core"""
+    if hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, {worker.cpu_id})
+        server.log.info("Worker %s pinned to CPU %s", worker.pid, worker.cpu_id)
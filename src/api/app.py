@@ -1,19 +1,55 @@
 """
-Production-ready Flask API with logging, validation, and monitoring
+Production-ready FastAPI app with logging, validation, and monitoring
 """
 
-from flask import Flask, request, jsonify
-from flask_cors import CORS
-from pydantic import BaseModel, ValidationError, Field
-from typing import Optional
-import time
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
+import msgspec
+from typing import Annotated
 from src.predict import ChurnPredictor
+from src.batching import BatchScheduler
+from src.metrics import RequestMetrics
+from src.api.probes import start_probe_server
 from src.logger import setup_logger
 from config import config
 
+@asynccontextmanager
+async def lifespan(app):
+    """Run the probe server alongside each worker process"""
+    probe_server = start_probe_server(
+        config.HOST,
+        config.PROBE_PORT,
+        predictor,
+        metrics
+    )
+    logger.info("Probe server listening on %s:%s", config.HOST, config.PROBE_PORT)
+    
+    yield
+    
+    probe_server.shutdown()
+
+
 # Initialize app
-app = Flask(__name__)
-CORS(app)
+app = FastAPI(
+    title='Customer Churn Prediction API',
+    version=config.MODEL_VERSION,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# /predict is called by backend services; only add CORS when browser
+# origins are configured, and then only for that fixed allow-list
+if config.ALLOWED_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=config.ALLOWED_ORIGINS,
+        allow_methods=['GET', 'POST'],
+        allow_headers=['Content-Type']
+    )
 
 # Setup logger
 logger = setup_logger(__name__)
@@ -23,170 +59,165 @@ try:
     predictor = ChurnPredictor()
     logger.info("Model loaded successfully")
 except Exception as e:
-    logger.error(f"Failed to load model: {e}")
+    logger.error("Failed to load model: %s", e)
     predictor = None
 
+# Coalesce concurrent requests into batched model calls
+scheduler = None
+if predictor is not None:
+    scheduler = BatchScheduler(
+        predictor.predict_batch,
+        max_batch=config.MAX_BATCH,
+        max_wait_ms=config.MAX_WAIT_MS
+    )
+    scheduler.start()
+    predictor.attach_scheduler(scheduler)
+
 # Metrics
-metrics = {
-    'total_requests': 0,
-    'successful_predictions': 0,
-    'failed_predictions': 0,
-    'errors': 0
-}
-
-
-# Pydantic model for input validation
-class CustomerInput(BaseModel):
-    age: int = Field(..., ge=18, le=100)
-    tenure_months: int = Field(..., ge=0, le=120)
-    monthly_charges: float = Field(..., ge=0, le=1000)
-    total_charges: float = Field(..., ge=0)
-    support_tickets: int = Field(..., ge=0, le=100)
-    login_frequency: int = Field(..., ge=0, le=1000)
-    feature_usage: float = Field(..., ge=0, le=1)
-    gender_encoded: int = Field(..., ge=0, le=1)
-    location_encoded: int = Field(..., ge=0, le=2)
-    contract_type_encoded: int = Field(..., ge=0, le=2)
-    internet_service_encoded: int = Field(..., ge=0, le=2)
-    payment_method_encoded: int = Field(..., ge=0, le=2)
-    charges_per_month: float = Field(..., ge=0)
-    support_per_month: float = Field(..., ge=0)
-    login_per_month: float = Field(..., ge=0)
-    is_new_customer: int = Field(..., ge=0, le=1)
-    is_high_value: int = Field(..., ge=0, le=1)
-    has_tech_support: int = Field(..., ge=0, le=1)
-    has_device_protection: int = Field(..., ge=0, le=1)
-    tenure_charges_interaction: float = Field(..., ge=0)
-    support_value_ratio: float = Field(..., ge=0)
-
-
-@app.route('/')
-def root():
+metrics = RequestMetrics()
+
+
+# Input schema, decoded and validated straight from the request bytes;
+# derived features are computed server-side by the predictor
+class CustomerRaw(msgspec.Struct):
+    age: Annotated[int, msgspec.Meta(ge=18, le=100)]
+    tenure_months: Annotated[int, msgspec.Meta(ge=0, le=120)]
+    monthly_charges: Annotated[float, msgspec.Meta(ge=0, le=1000)]
+    total_charges: Annotated[float, msgspec.Meta(ge=0)]
+    support_tickets: Annotated[int, msgspec.Meta(ge=0, le=100)]
+    login_frequency: Annotated[int, msgspec.Meta(ge=0, le=1000)]
+    feature_usage: Annotated[float, msgspec.Meta(ge=0, le=1)]
+    gender_encoded: Annotated[int, msgspec.Meta(ge=0, le=1)]
+    location_encoded: Annotated[int, msgspec.Meta(ge=0, le=2)]
+    contract_type_encoded: Annotated[int, msgspec.Meta(ge=0, le=2)]
+    internet_service_encoded: Annotated[int, msgspec.Meta(ge=0, le=2)]
+    payment_method_encoded: Annotated[int, msgspec.Meta(ge=0, le=2)]
+    login_per_month: Annotated[float, msgspec.Meta(ge=0)]
+    is_new_customer: Annotated[int, msgspec.Meta(ge=0, le=1)]
+    is_high_value: Annotated[int, msgspec.Meta(ge=0, le=1)]
+    has_tech_support: Annotated[int, msgspec.Meta(ge=0, le=1)]
+    has_device_protection: Annotated[int, msgspec.Meta(ge=0, le=1)]
+
+
+# strict=False keeps the lax coercions clients relied on (e.g. 35.0 for an int)
+customer_decoder = msgspec.json.Decoder(CustomerRaw, strict=False)
+
+
+@app.get('/')
+async def root():
     """Root endpoint"""
-    return jsonify({
+    return {
         'service': 'Customer Churn Prediction API',
         'version': config.MODEL_VERSION,
         'api_version': config.API_VERSION,
         'endpoints': {
-            'predict': f'/api/{config.API_VERSION}/predict',
+            'predict': f'/api/{config.API_VERSION}/predict'
+        },
+        # Served on a separate port so probes never queue behind predictions
+        'probes': {
+            'port': config.PROBE_PORT,
             'health': '/health',
             'ready': '/ready',
             'metrics': '/metrics'
         }
-    })
-
-
-@app.route('/health')
-def health():
-    """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': time.time()
-    }), 200
-
-
-@app.route('/ready')
-def ready():
-    """Readiness check endpoint"""
-    if predictor is None or not predictor.is_ready():
-        return jsonify({
-            'status': 'not ready',
-            'reason': 'Model not loaded'
-        }), 503
-    
-    return jsonify({
-        'status': 'ready',
-        'model_version': config.MODEL_VERSION
-    }), 200
-
-
-@app.route('/metrics')
-def get_metrics():
-    """Return API metrics"""
-    if not config.ENABLE_METRICS:
-        return jsonify({'error': 'Metrics disabled'}), 403
-    
-    return jsonify(metrics), 200
+    }
 
 
-@app.route(f'/api/{config.API_VERSION}/predict', methods=['POST'])
-def predict():
+@app.post(f'/api/{config.API_VERSION}/predict')
+async def predict(request: Request):
     """Predict customer churn"""
     
-    metrics['total_requests'] += 1
+    metrics.total_requests.inc()
     
     # Check if model is loaded
     if predictor is None or not predictor.is_ready():
-        metrics['errors'] += 1
+        metrics.errors.inc()
         logger.error("Model not loaded")
-        return jsonify({
+        return ORJSONResponse({
             'success': False,
             'error': 'Model not available'
-        }), 503
+        }, status_code=503)
     
     # Validate input
     try:
-        customer_data = CustomerInput(**request.get_json())
-    except ValidationError as e:
-        metrics['failed_predictions'] += 1
-        logger.warning(f"Validation error: {e}")
-        return jsonify({
+        # Single C-level parse from raw bytes into the typed struct
+        customer_data = customer_decoder.decode(await request.body())
+    except msgspec.ValidationError as e:
+        metrics.failed_predictions.inc()
+        logger.warning("Validation error: %s", e)
+        return ORJSONResponse({
             'success': False,
             'error': 'Invalid input',
-            'details': e.errors()
-        }), 400
+            'details': str(e)
+        }, status_code=400)
     except Exception as e:
-        metrics['errors'] += 1
-        logger.error(f"Input error: {e}")
-        return jsonify({
+        metrics.errors.inc()
+        logger.error("Input error: %s", e)
+        return ORJSONResponse({
             'success': False,
             'error': 'Invalid request format'
-        }), 400
+        }, status_code=400)
     
     # Make prediction
     try:
-        result = predictor.predict(customer_data.dict())
-        metrics['successful_predictions'] += 1
-        
-        logger.info(f"Prediction successful: {result['churn_prediction']}")
+        result = await predictor.predict_async(customer_data)
+        metrics.successful_predictions.inc()
+        logger.debug("Prediction successful: %s", result['churn_prediction'])
         
-        return jsonify({
+        return {
             'success': True,
             'model_version': config.MODEL_VERSION,
             'result': result
-        }), 200
+        }
+    
+    except asyncio.TimeoutError:
+        metrics.failed_predictions.inc()
+        logger.error("Prediction timed out after %ss", config.BATCH_TIMEOUT)
+        return ORJSONResponse({
+            'success': False,
+            'error': 'Prediction timed out'
+        }, status_code=504)
     
     except Exception as e:
-        metrics['failed_predictions'] += 1
-        logger.error(f"Prediction error: {e}")
-        return jsonify({
+        metrics.failed_predictions.inc()
+        logger.error("Prediction error: %r", e)
+        return ORJSONResponse({
             'success': False,
             'error': 'Prediction failed'
-        }), 500
+        }, status_code=500)
 
 
-@app.errorhandler(404)
-def not_found(error):
-    return jsonify({
+@app.exception_handler(StarletteHTTPException)
+async def http_error(request, error):
+    if error.status_code == 404:
+        return ORJSONResponse({
+            'success': False,
+            'error': 'Endpoint not found'
+        }, status_code=404)
+    
+    return ORJSONResponse({
         'success': False,
-        'error': 'Endpoint not found'
-    }), 404
+        'error': error.detail
+    }, status_code=error.status_code)
 
 
-@app.errorhandler(500)
-def internal_error(error):
-    metrics['errors'] += 1
-    logger.error(f"Internal error: {error}")
-    return jsonify({
+@app.exception_handler(Exception)
+async def internal_error(request, error):
+    metrics.errors.inc()
+    logger.error("Internal error: %s", error)
+    return ORJSONResponse({
         'success': False,
         'error': 'Internal server error'
-    }), 500
+    }, status_code=500)
 
 
 if __name__ == '__main__':
-    # Only for development - use Gunicorn in production
-    app.run(
+    # Only for development - use uvicorn workers in production
+    import uvicorn
+    
+    uvicorn.run(
+        app,
         host=config.HOST,
         port=config.PORT,
-        debug=config.DEBUG
+        log_level=config.LOG_LEVEL.lower()
     )
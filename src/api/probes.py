@@ -0,0 +1,99 @@
+"""
+Health, readiness and metrics endpoints served outside the prediction path
+"""
+
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import orjson
+from config import config
+
+
+class ProbeServer(ThreadingHTTPServer):
+    """Threaded HTTP server that can share its port across worker processes"""
+
+    daemon_threads = True
+
+    def server_bind(self):
+        # Each Gunicorn worker binds the same port; the kernel spreads
+        # probes across whichever workers are alive
+        if hasattr(socket, 'SO_REUSEPORT'):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+def _make_handler(predictor, metrics):
+    """Build a request handler bound to this process's predictor and metrics"""
+
+    class ProbeHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            if self.path == '/health':
+                self._send(200, {
+                    'status': 'healthy',
+                    'timestamp': time.time()
+                })
+
+            elif self.path == '/ready':
+                if predictor is None or not predictor.is_ready():
+                    self._send(503, {
+                        'status': 'not ready',
+                        'reason': 'Model not loaded'
+                    })
+                else:
+                    self._send(200, {
+                        'status': 'ready',
+                        'model_version': config.MODEL_VERSION
+                    })
+
+            elif self.path == '/metrics':
+                if not config.ENABLE_METRICS:
+                    self._send(403, {'error': 'Metrics disabled'})
+                else:
+                    self._send(200, metrics.snapshot())
+
+            else:
+                self._send(404, {
+                    'success': False,
+                    'error': 'Endpoint not found'
+                })
+
+        def _send(self, status, payload):
+            body = orjson.dumps(payload)
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Probes hit every few seconds; keep them out of the logs
+            pass
+
+    return ProbeHandler
+
+
+def start_probe_server(host, port, predictor, metrics):
+    """
+    Serve /health, /ready and /metrics from a daemon thread
+
+    Args:
+        host: interface to bind
+        port: port to bind (0 picks a free one)
+        predictor: ChurnPredictor or None
+        metrics: RequestMetrics for this process
+
+    Returns:
+        running ProbeServer; call shutdown() to stop it
+    """
+
+    server = ProbeServer((host, port), _make_handler(predictor, metrics))
+    thread = threading.Thread(
+        target=server.serve_forever,
+        name='probe-server',
+        daemon=True
+    )
+    thread.start()
+
+    return server
@@ -0,0 +1,110 @@
+"""
+Micro-batching scheduler that coalesces concurrent prediction requests
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from src.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class BatchScheduler:
+    """Collect queued requests and score them with a single batched call"""
+
+    def __init__(self, predict_batch, max_batch=64, max_wait_ms=5):
+        """
+        Args:
+            predict_batch: callable taking a list of inputs and returning
+                a list of results in the same order
+            max_batch: maximum number of requests per batch
+            max_wait_ms: how long to wait for a batch to fill up
+        """
+        self._predict_batch = predict_batch
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._queue = queue.Queue()
+        self._worker = None
+
+        # Worker threads do not survive fork (Gunicorn --preload)
+        os.register_at_fork(after_in_child=self._restart_after_fork)
+
+    def start(self):
+        """Start the background worker thread"""
+        if self._worker is not None and self._worker.is_alive():
+            return
+
+        self._worker = threading.Thread(
+            target=self._run,
+            name='batch-scheduler',
+            daemon=True
+        )
+        self._worker.start()
+
+    def _restart_after_fork(self):
+        """Start a fresh queue and worker in a forked child"""
+        if self._worker is None:
+            return
+
+        self._queue = queue.Queue()
+        self._worker = None
+        self.start()
+
+    def enqueue(self, features):
+        """
+        Queue a single request for the next batch
+
+        Args:
+            features: input for one prediction
+
+        Returns:
+            concurrent.futures.Future resolved with this input's result
+        """
+        future = Future()
+        self._queue.put((features, future))
+        return future
+
+    def submit(self, features, timeout=None):
+        """Enqueue a single request and block until its result is ready"""
+        return self.enqueue(features).result(timeout)
+
+    def _collect(self):
+        """Block for one item, then gather more until full or deadline"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self._max_wait
+
+        while len(batch) < self._max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        """Worker loop"""
+        while True:
+            # Drop requests whose caller already gave up
+            batch = [
+                (features, future) for features, future in self._collect()
+                if future.set_running_or_notify_cancel()
+            ]
+            if not batch:
+                continue
+
+            try:
+                results = self._predict_batch([features for features, _ in batch])
+            except Exception as e:
+                logger.error("Batch prediction failed: %s", e)
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
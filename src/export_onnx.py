@@ -0,0 +1,44 @@
+"""
+Export the trained XGBoost model to ONNX for ONNX Runtime inference
+"""
+
+import copy
+from onnxmltools import convert_xgboost
+from onnxmltools.convert.common.data_types import FloatTensorType
+from src.model import load_model
+from src.logger import setup_logger
+from config import config
+
+logger = setup_logger(__name__)
+
+
+def export_onnx(model, path):
+    """
+    Convert an XGBClassifier to ONNX and write it to disk
+    
+    Args:
+        model: trained XGBClassifier
+        path: output .onnx file
+    """
+    
+    n_features = model.get_booster().num_features()
+    
+    # The converter only understands f0..fN split names, so drop the
+    # column names on a copy (column order is unchanged)
+    model = copy.deepcopy(model)
+    model.get_booster().feature_names = None
+    
+    onnx_model = convert_xgboost(
+        model,
+        initial_types=[('input', FloatTensorType([None, n_features]))]
+    )
+    
+    with open(path, 'wb') as f:
+        f.write(onnx_model.SerializeToString())
+    
+    logger.info("ONNX model written to %s", path)
+
+
+if __name__ == '__main__':
+    path = config.ONNX_MODEL_PATH or 'models/churn_model.onnx'
+    export_onnx(load_model(config.MODEL_PATH), path)
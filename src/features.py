@@ -0,0 +1,91 @@
+"""
+Model input layout and the generated row writer
+"""
+
+
+# Fields sent by clients (matches CustomerRaw)
+RAW_FEATURES = (
+    'age',
+    'tenure_months',
+    'monthly_charges',
+    'total_charges',
+    'support_tickets',
+    'login_frequency',
+    'feature_usage',
+    'gender_encoded',
+    'location_encoded',
+    'contract_type_encoded',
+    'internet_service_encoded',
+    'payment_method_encoded',
+    'login_per_month',
+    'is_new_customer',
+    'is_high_value',
+    'has_tech_support',
+    'has_device_protection',
+)
+
+# Features computed server-side, as expressions over RAW_FEATURES.
+# A ratio with a zero denominator (tenure_months == 0, monthly_charges == 0)
+# is 0.0: no history or no charges means no rate (see tests/test_features.py)
+DERIVED_FEATURES = {
+    'charges_per_month': 'monthly_charges',
+    'support_per_month': 'support_tickets / tenure_months if tenure_months else 0.0',
+    'tenure_charges_interaction': 'tenure_months * monthly_charges',
+    'support_value_ratio': 'support_tickets / monthly_charges if monthly_charges else 0.0',
+}
+
+# Default column order expected by the model
+FEATURE_ORDER = (
+    'age',
+    'tenure_months',
+    'monthly_charges',
+    'total_charges',
+    'support_tickets',
+    'login_frequency',
+    'feature_usage',
+    'gender_encoded',
+    'location_encoded',
+    'contract_type_encoded',
+    'internet_service_encoded',
+    'payment_method_encoded',
+    'charges_per_month',
+    'support_per_month',
+    'login_per_month',
+    'is_new_customer',
+    'is_high_value',
+    'has_tech_support',
+    'has_device_protection',
+    'tenure_charges_interaction',
+    'support_value_ratio',
+)
+
+
+def compile_fill(feature_order):
+    """
+    Generate a row writer specialized for the model's column order
+    
+    The returned fill(buf, i, *raw) has one straight-line assignment per
+    column, with the derived features computed inline, e.g.
+    
+        buf[i, 13] = support_tickets / tenure_months if tenure_months else 0.0  # support_per_month
+    
+    Args:
+        feature_order: model column names
+    
+    Returns:
+        function taking (buf, row_index, *values in RAW_FEATURES order)
+    """
+    
+    lines = [f"def fill(buf, i, {', '.join(RAW_FEATURES)}):"]
+    for col, name in enumerate(feature_order):
+        if name in DERIVED_FEATURES:
+            expr = DERIVED_FEATURES[name]
+        elif name in RAW_FEATURES:
+            expr = name
+        else:
+            raise ValueError(f"Unknown model feature: {name}")
+        lines.append(f"    buf[i, {col}] = {expr}  # {name}")
+    
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['fill']
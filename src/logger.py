@@ -2,29 +2,34 @@
 Logging configuration
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
 from config import config
 
+LOG_DIR = 'logs'
+# One file per process (see _start_listener); {pid} is filled in there
+LOG_FILE = os.path.join(LOG_DIR, 'app-{pid}.log')
 
-def setup_logger(name):
-    """Setup logger with file and console handlers"""
+
+def _start_listener(log_queue):
+    """Start a background listener that owns the file and console handlers"""
     
     # Create logs directory
-    os.makedirs('logs', exist_ok=True)
-    
-    # Create logger
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, config.LOG_LEVEL))
-    
-    # Prevent duplicate handlers
-    if logger.handlers:
-        return logger
+    os.makedirs(LOG_DIR, exist_ok=True)
     
-    # File handler
-    log_file = f"logs/app_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_file)
+    # File handler, rotated daily by the handler itself. Each process
+    # (every Gunicorn worker gets a fresh listener after fork) writes and
+    # rotates its own file, so no two processes rename the same file.
+    # The file is opened on first write.
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        LOG_FILE.format(pid=os.getpid()),
+        when='midnight',
+        backupCount=14,
+        delay=True
+    )
     file_handler.setLevel(logging.INFO)
     
     # Console handler
@@ -38,8 +43,53 @@ def setup_logger(name):
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        file_handler,
+        console_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    
+    # Drain pending records on shutdown
+    atexit.register(listener.stop)
+    
+    return listener
+
+
+def _restart_after_fork():
+    """Give a forked child (e.g. a preloaded Gunicorn worker) its own listener"""
+    global _log_queue, _listener
+    
+    # The parent's listener thread does not exist in the child
+    atexit.unregister(_listener.stop)
+    
+    _log_queue = queue.Queue(-1)
+    for handler in _queue_handlers:
+        handler.queue = _log_queue
+    _listener = _start_listener(_log_queue)
+
+
+# Loggers only enqueue records; writes happen on the listener thread
+_log_queue = queue.Queue(-1)
+_queue_handlers = []
+_listener = _start_listener(_log_queue)
+os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def setup_logger(name):
+    """Setup logger that hands records to the background listener"""
+    
+    # Create logger
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, config.LOG_LEVEL))
+    
+    # Prevent duplicate handlers
+    if logger.handlers:
+        return logger
+    
+    handler = logging.handlers.QueueHandler(_log_queue)
+    _queue_handlers.append(handler)
+    logger.addHandler(handler)
     
     return logger
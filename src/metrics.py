@@ -0,0 +1,45 @@
+"""
+Lock-free request counters
+"""
+
+import itertools
+import threading
+
+
+class Counter:
+    """Monotonic counter whose increment is a single GIL-atomic next() call"""
+    
+    def __init__(self):
+        self._count = itertools.count()
+        self._reads = itertools.count()
+        self._read_lock = threading.Lock()
+    
+    def inc(self):
+        """Increment by one"""
+        next(self._count)
+    
+    @property
+    def value(self):
+        """Current count"""
+        # Reading advances the underlying count too, so subtract prior reads
+        with self._read_lock:
+            return next(self._count) - next(self._reads)
+
+
+class RequestMetrics:
+    """Counters exposed by the /metrics endpoint"""
+    
+    FIELDS = (
+        'total_requests',
+        'successful_predictions',
+        'failed_predictions',
+        'errors',
+    )
+    
+    def __init__(self):
+        for name in self.FIELDS:
+            setattr(self, name, Counter())
+    
+    def snapshot(self):
+        """Return current values as a dict"""
+        return {name: getattr(self, name).value for name in self.FIELDS}
@@ -2,62 +2,303 @@
 Prediction module with singleton pattern for model loading
 """
 
-import pandas as pd
-from src.model import load_model
+import asyncio
+import functools
+import threading
+from concurrent.futures import Future
+import numpy as np
+import xgboost as xgb
+from src.features import RAW_FEATURES, FEATURE_ORDER, compile_fill
+from src.tree_walker import CompiledTrees, is_available as walker_available
 from src.logger import setup_logger
 from config import config
 
+try:
+    import onnxruntime as ort
+except ImportError:  # onnxruntime is optional; batches fall back to XGBoost
+    ort = None
+
 logger = setup_logger(__name__)
 
+# Risk level by int(churn_prob * 10): Low below 0.4, Medium below 0.7,
+# High from 0.7 (index 10 covers churn_prob == 1.0)
+_RISK = ('Low',) * 4 + ('Medium',) * 3 + ('High',) * 3 + ('High',)
+
+def _probe_rows(n_features, n_rows=16, seed=0):
+    """Deterministic float32 rows spanning several magnitudes, for parity checks"""
+    rng = np.random.default_rng(seed)
+    scale = rng.choice([1.0, 10.0, 100.0, 1000.0], size=(n_rows, n_features))
+    return (rng.uniform(0, 1, size=(n_rows, n_features)) * scale).astype(np.float32)
+
 
 class ChurnPredictor:
     """Singleton predictor class"""
     
     _instance = None
     _model = None
+    _booster = None
+    _walker = None
+    _session = None
+    _feature_order = FEATURE_ORDER
+    _fill = None
+    _scheduler = None
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._local = threading.local()
+            cls._instance._cache = functools.lru_cache(
+                maxsize=config.PREDICT_CACHE_SIZE
+            )(cls._instance._predict_raw)
             cls._instance._load_model()
         return cls._instance
     
     def _load_model(self):
         """Load model once"""
         try:
-            self._model = load_model(config.MODEL_PATH)
-            logger.info(f"Model loaded from {config.MODEL_PATH}")
+            if config.MODEL_PATH.endswith('.json'):
+                # Native XGBoost format saved with booster.save_model()
+                self._model = xgb.Booster(model_file=config.MODEL_PATH)
+            else:
+                from src.model import load_model
+                self._model = load_model(config.MODEL_PATH)
+            logger.info("Model loaded from %s", config.MODEL_PATH)
         except Exception as e:
-            logger.error(f"Failed to load model: {e}")
+            logger.error("Failed to load model: %s", e)
             self._model = None
+            return
+        
+        # Unwrap XGBClassifier so predictions skip the sklearn layer and
+        # per-call DMatrix construction
+        if isinstance(self._model, xgb.Booster):
+            self._booster = self._model
+        elif hasattr(self._model, 'get_booster'):
+            self._booster = self._model.get_booster()
+        
+        # Use the column order the model was fitted with, if it recorded one
+        feature_names = getattr(self._model, 'feature_names_in_', None)
+        if feature_names is None and self._booster is not None:
+            feature_names = self._booster.feature_names
+        if feature_names is not None:
+            self._feature_order = tuple(feature_names)
+        self._fill = compile_fill(self._feature_order)
+        
+        if self._booster is not None:
+            # One thread per worker process; scale out with more workers
+            self._booster.set_param({'nthread': 1})
+            
+            if config.USE_TREE_WALKER and walker_available():
+                self._walker = self._compile_walker()
+        
+        if config.ONNX_MODEL_PATH and ort is not None:
+            self._session = self._load_session(config.ONNX_MODEL_PATH)
+    
+    def _load_session(self, path):
+        """Open an ONNX Runtime session for batched inference, or None if it can't match the model"""
+        try:
+            so = ort.SessionOptions()
+            # One thread per worker process, like the booster
+            so.intra_op_num_threads = 1
+            so.inter_op_num_threads = 1
+            so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            
+            session = ort.InferenceSession(
+                path,
+                sess_options=so,
+                providers=['CPUExecutionProvider']
+            )
+            
+            session_input = session.get_inputs()[0]
+            # Converted classifiers output (label, probabilities)
+            output_name = session.get_outputs()[-1].name
+            
+            # A stale export or one with other columns must not serve batches
+            n_features = len(self._feature_order)
+            if len(session_input.shape) != 2 or session_input.shape[1] != n_features:
+                raise ValueError(
+                    f"input shape {session_input.shape} does not match {n_features} features"
+                )
+            
+            probe = _probe_rows(n_features)
+            actual = session.run([output_name], {session_input.name: probe})[0][:, 1]
+            if not np.allclose(actual, self._reference_proba(probe), atol=1e-4):
+                raise ValueError("ONNX output does not match the loaded model")
+        except Exception as e:
+            logger.warning("ONNX Runtime disabled: %s", e)
+            return None
+        
+        self._onnx_input = session_input.name
+        self._onnx_output = output_name
+        
+        logger.info("Using ONNX Runtime model from %s", path)
+        return session
+    
+    def _reference_proba(self, arr):
+        """Churn probabilities from the loaded XGBoost/sklearn model itself"""
+        if self._booster is not None:
+            return self._booster.inplace_predict(arr)
+        return self._model.predict_proba(arr)[:, 1]
+    
+    def _compile_walker(self):
+        """Build the numba tree walker, or None if it can't match XGBoost"""
+        try:
+            walker = CompiledTrees(self._booster)
+            
+            # Check against XGBoost once (this also triggers JIT compilation);
+            # the NaN cells exercise each split's default direction
+            probe = _probe_rows(len(self._feature_order))
+            probe[::2, ::3] = np.nan
+            actual = np.concatenate([walker.predict(probe[i:i + 1]) for i in range(len(probe))])
+            expected = self._booster.inplace_predict(probe)
+            if not np.allclose(actual, expected, atol=1e-5):
+                raise ValueError("walker output does not match booster")
+        except Exception as e:
+            logger.warning("Compiled tree walker disabled: %s", e)
+            return None
+        
+        logger.info("Using compiled tree walker for single-row predictions")
+        return walker
+    
+    def _buffer(self):
+        """Return this thread's preallocated single-row input buffer"""
+        buf = getattr(self._local, 'buf', None)
+        if buf is None:
+            buf = np.empty((1, len(self._feature_order)), dtype=np.float32)
+            self._local.buf = buf
+        return buf
     
     def is_ready(self):
         """Check if model is ready"""
         return self._model is not None
     
+    def attach_scheduler(self, scheduler):
+        """Route cache misses through a BatchScheduler instead of scoring inline"""
+        self._scheduler = scheduler
+    
     def predict(self, customer_data):
         """
         Predict churn probability
         
         Args:
-            customer_data: dict with customer features
+            customer_data: validated CustomerRaw (any object with the raw fields)
         
         Returns:
             dict with prediction results
         """
         
+        future = self._lookup(customer_data)
+        churn_prob = future.result(timeout=config.BATCH_TIMEOUT)
+        
+        return self._format_result(churn_prob)
+    
+    async def predict_async(self, customer_data):
+        """
+        Predict churn probability without blocking the event loop
+        
+        Args:
+            customer_data: validated CustomerRaw (any object with the raw fields)
+        
+        Returns:
+            dict with prediction results
+        """
+        
+        future = self._lookup(customer_data)
+        
+        # Shield the cached future so one caller's timeout doesn't cancel it
+        # for everyone else waiting on the same key
+        churn_prob = await asyncio.wait_for(
+            asyncio.shield(asyncio.wrap_future(future)),
+            config.BATCH_TIMEOUT
+        )
+        
+        return self._format_result(churn_prob)
+    
+    def _lookup(self, customer_data):
+        """Return the (possibly cached) future for this customer's features"""
+        
         if not self.is_ready():
             raise RuntimeError("Model not loaded")
         
-        # Convert to DataFrame
-        df = pd.DataFrame([customer_data])
+        # Quantize floats so near-identical inputs share a cache entry
+        key = tuple(round(getattr(customer_data, name), 3) for name in RAW_FEATURES)
+        
+        future = self._cache(key)
+        if future.done() and (future.cancelled() or future.exception() is not None):
+            # Failed predictions must not stay cached; score this key again
+            self._cache.cache_clear()
+            future = self._cache(key)
+        
+        return future
+    
+    def _predict_raw(self, features):
+        """
+        Start scoring one raw feature tuple (in RAW_FEATURES order)
+        
+        Returns:
+            concurrent.futures.Future resolved with the churn probability
+        """
+        
+        if self._scheduler is not None:
+            return self._scheduler.enqueue(features)
         
-        # Predict
-        churn_prob = self._model.predict_proba(df)[:, 1][0]
+        # Fill the reusable buffer and predict inline
+        buf = self._buffer()
+        self._fill(buf, 0, *features)
+        
+        future = Future()
+        future.set_result(float(self._predict_proba(buf)[0]))
+        return future
+    
+    @staticmethod
+    def _format_result(churn_prob):
+        """Build the response payload for one probability"""
         churn_pred = 1 if churn_prob > 0.5 else 0
         
         return {
-            'churn_prediction': int(churn_pred),
-            'churn_probability': float(round(churn_prob, 4)),
-            'risk_level': 'High' if churn_prob > 0.7 else 'Medium' if churn_prob > 0.4 else 'Low'
+            'churn_prediction': churn_pred,
+            'churn_probability': round(churn_prob, 4),
+            'risk_level': _RISK[min(int(churn_prob * 10), 10)]
         }
+    
+    def predict_batch(self, rows):
+        """
+        Predict churn probability for several customers in one model call
+        
+        Args:
+            rows: list of raw feature tuples in RAW_FEATURES order
+        
+        Returns:
+            list of churn probabilities, in input order
+        """
+        
+        if not self.is_ready():
+            raise RuntimeError("Model not loaded")
+        
+        # Fill a single (N, n_features) float32 array, the dtype the
+        # hist tree thresholds are stored in
+        arr = np.empty((len(rows), len(self._feature_order)), dtype=np.float32)
+        fill = self._fill
+        for i, row in enumerate(rows):
+            fill(arr, i, *row)
+        
+        return self._predict_proba(arr).tolist()
+    
+    def _predict_proba(self, arr):
+        """
+        Single model entry point shared by the inline and batched paths
+        
+        Args:
+            arr: (N, n_features) array in model column order
+        
+        Returns:
+            (N,) array of churn probabilities
+        """
+        # Single rows skip the XGBoost FFI entirely
+        if self._walker is not None and arr.shape[0] == 1:
+            return self._walker.predict(arr)
+        if self._session is not None:
+            probs = self._session.run([self._onnx_output], {self._onnx_input: arr})[0]
+            return probs[:, 1]
+        if self._booster is not None:
+            return self._booster.inplace_predict(arr)
+        return self._model.predict_proba(arr)[:, 1]
@@ -26,9 +26,9 @@ class ChurnPredictor:
         """Load model once"""
         try:
             self._model = load_model(config.MODEL_PATH)
-            logger.info(f"Model loaded from {config.MODEL_PATH}")
+            logger.info("Model loaded from %s", config.MODEL_PATH)
         except Exception as e:
-            logger.error(f"Failed to load model: {e}")
+            logger.error("Failed to load model: %s", e)
             self._model = None
     
     def is_ready(self):
@@ -0,0 +1,120 @@
+"""
+Numba-compiled tree walker for single-row XGBoost predictions
+"""
+
+import json
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; callers fall back to XGBoost
+    njit = None
+
+
+def is_available():
+    """Check if numba is installed"""
+    return njit is not None
+
+
+def _predict_one(x, feat, thresh, left, right, default_left, leaf, roots, base_margin):
+    """Sum leaf values over all trees for one row and return the probability"""
+    margin = base_margin
+    for t in range(roots.shape[0]):
+        node = roots[t]
+        while left[node] != -1:
+            value = x[feat[node]]
+            if np.isnan(value):
+                node = left[node] if default_left[node] else right[node]
+            elif value < thresh[node]:
+                node = left[node]
+            else:
+                node = right[node]
+        margin += leaf[node]
+    return 1.0 / (1.0 + np.exp(-margin))
+
+
+if njit is not None:
+    # No 'nnan'/'ninf' flags: the walker must still see NaN (missing) values
+    # All predictions run on the batch-scheduler thread; nogil lets the
+    # event loop and probe threads keep running while it walks the trees
+    _predict_one = njit(
+        cache=True,
+        nogil=True,
+        fastmath={'reassoc', 'contract', 'arcp'}
+    )(_predict_one)
+
+
+class CompiledTrees:
+    """Flattened copy of a binary:logistic gbtree booster"""
+
+    def __init__(self, booster):
+        """
+        Args:
+            booster: trained xgboost.Booster
+        """
+
+        model = json.loads(booster.save_raw(raw_format='json'))
+        learner = model['learner']
+
+        objective = learner['objective']['name']
+        if objective != 'binary:logistic':
+            raise ValueError(f"Unsupported objective: {objective}")
+
+        gbm = learner['gradient_booster']
+        if gbm['name'] != 'gbtree':
+            raise ValueError(f"Unsupported booster: {gbm['name']}")
+
+        # base_score is stored in probability space (a 1-element list in newer xgboost)
+        base_score = float(str(learner['learner_model_param']['base_score']).strip('[]'))
+        self._base_margin = float(np.log(base_score / (1.0 - base_score)))
+
+        feat, thresh, left, right, default_left, roots = [], [], [], [], [], []
+        offset = 0
+        for tree in gbm['model']['trees']:
+            if any(tree.get('split_type', [])):
+                raise ValueError("Categorical splits are not supported")
+
+            tree_left = np.asarray(tree['left_children'], dtype=np.int32)
+            tree_right = np.asarray(tree['right_children'], dtype=np.int32)
+
+            # Re-base child indices into the flattened node arrays
+            left.append(np.where(tree_left == -1, -1, tree_left + offset))
+            right.append(np.where(tree_right == -1, -1, tree_right + offset))
+            feat.append(np.asarray(tree['split_indices'], dtype=np.int32))
+            # Leaves keep their value in split_conditions
+            thresh.append(np.asarray(tree['split_conditions'], dtype=np.float32))
+            default_left.append(np.asarray(tree['default_left'], dtype=np.bool_))
+
+            roots.append(offset)
+            offset += len(tree_left)
+
+        self._feat = np.concatenate(feat)
+        self._thresh = np.concatenate(thresh)
+        self._left = np.concatenate(left).astype(np.int32)
+        self._right = np.concatenate(right).astype(np.int32)
+        self._default_left = np.concatenate(default_left)
+        self._leaf = self._thresh.astype(np.float64)
+        self._roots = np.asarray(roots, dtype=np.int32)
+
+    def predict(self, arr):
+        """
+        Predict churn probability for a single row
+
+        Args:
+            arr: (1, n_features) float32 array
+
+        Returns:
+            (1,) array of churn probabilities
+        """
+        prob = _predict_one(
+            arr[0],
+            self._feat,
+            self._thresh,
+            self._left,
+            self._right,
+            self._default_left,
+            self._leaf,
+            self._roots,
+            self._base_margin
+        )
+        return np.array([prob])
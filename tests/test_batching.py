@@ -0,0 +1,66 @@
+"""
+Batch scheduler tests
+"""
+
+import sys
+sys.path.insert(0, '..')
+
+import threading
+from src.batching import BatchScheduler
+
+
+def test_submit_returns_result():
+    """Test a single request goes through the worker"""
+    scheduler = BatchScheduler(lambda items: [x * 2 for x in items], max_wait_ms=1)
+    scheduler.start()
+
+    assert scheduler.submit(21, timeout=1) == 42
+
+
+def test_concurrent_requests_are_batched():
+    """Test concurrent requests share a batch and keep their order"""
+    batch_sizes = []
+
+    def predict_batch(items):
+        batch_sizes.append(len(items))
+        return [x + 1 for x in items]
+
+    scheduler = BatchScheduler(predict_batch, max_batch=8, max_wait_ms=50)
+    scheduler.start()
+
+    results = {}
+
+    def worker(i):
+        results[i] = scheduler.submit(i, timeout=2)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == {i: i + 1 for i in range(8)}
+    assert len(batch_sizes) < 8
+
+
+def test_batch_error_is_raised():
+    """Test errors in the batch call reach every caller"""
+    def predict_batch(items):
+        raise ValueError("boom")
+
+    scheduler = BatchScheduler(predict_batch, max_wait_ms=1)
+    scheduler.start()
+
+    try:
+        scheduler.submit(1, timeout=1)
+    except ValueError:
+        pass
+    else:
+        assert False, "expected ValueError"
+
+
+if __name__ == '__main__':
+    test_submit_returns_result()
+    test_concurrent_requests_are_batched()
+    test_batch_error_is_raised()
+    print("All tests passed!")
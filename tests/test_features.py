@@ -0,0 +1,96 @@
+"""
+Feature layout tests
+"""
+
+import sys
+sys.path.insert(0, '..')
+
+from src.features import RAW_FEATURES, FEATURE_ORDER, compile_fill
+
+
+class Row(dict):
+    """Stand-in for a numpy buffer: records buf[i, col] writes"""
+
+
+# README example payload
+CUSTOMER = {
+    'age': 35,
+    'tenure_months': 12,
+    'monthly_charges': 65.0,
+    'total_charges': 780.0,
+    'support_tickets': 2,
+    'login_frequency': 15,
+    'feature_usage': 0.6,
+    'gender_encoded': 1,
+    'location_encoded': 2,
+    'contract_type_encoded': 0,
+    'internet_service_encoded': 1,
+    'payment_method_encoded': 1,
+    'login_per_month': 1.25,
+    'is_new_customer': 0,
+    'is_high_value': 0,
+    'has_tech_support': 1,
+    'has_device_protection': 0,
+}
+
+
+def test_derived_features():
+    """Test derived columns for the README example"""
+    fill = compile_fill(FEATURE_ORDER)
+    buf = Row()
+    fill(buf, 0, *(CUSTOMER[name] for name in RAW_FEATURES))
+
+    expected = {12: 65.0, 13: 0.1667, 19: 780.0, 20: 0.0308}
+    for col, value in expected.items():
+        assert abs(buf[0, col] - value) < 1e-4, (col, buf[0, col])
+
+
+def test_small_charges_not_floored():
+    """Test charges below 1.0 divide as-is"""
+    fill = compile_fill(FEATURE_ORDER)
+    buf = Row()
+    customer = dict(CUSTOMER, monthly_charges=0.5)
+    fill(buf, 0, *(customer[name] for name in RAW_FEATURES))
+
+    assert buf[0, 20] == 4.0
+
+
+def test_zero_denominators():
+    """Test ratios over a zero tenure or zero charges are 0.0"""
+    fill = compile_fill(FEATURE_ORDER)
+    buf = Row()
+    customer = dict(CUSTOMER, tenure_months=0, monthly_charges=0.0)
+    fill(buf, 0, *(customer[name] for name in RAW_FEATURES))
+
+    assert buf[0, 13] == 0.0  # support_per_month
+    assert buf[0, 20] == 0.0  # support_value_ratio
+
+
+def test_raw_features_copied():
+    """Test raw columns land where FEATURE_ORDER puts them"""
+    fill = compile_fill(FEATURE_ORDER)
+    buf = Row()
+    fill(buf, 3, *(CUSTOMER[name] for name in RAW_FEATURES))
+
+    for col, name in enumerate(FEATURE_ORDER):
+        if name in CUSTOMER:
+            assert buf[3, col] == CUSTOMER[name]
+
+
+def test_unknown_feature_raises():
+    """Test an unknown model feature is rejected"""
+    try:
+        compile_fill(FEATURE_ORDER + ('bogus',))
+    except ValueError:
+        pass
+    else:
+        assert False, "expected ValueError"
+
+
+if __name__ == '__main__':
+    test_derived_features()
+    test_small_charges_not_floored()
+    test_zero_denominators()
+    test_raw_features_copied()
+    test_unknown_feature_raises()
+    print("All tests passed!")
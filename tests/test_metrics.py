@@ -0,0 +1,37 @@
+"""
+Metrics counter tests
+"""
+
+import sys
+sys.path.insert(0, '..')
+
+from src.metrics import Counter, RequestMetrics
+
+
+def test_counter_reads_do_not_change_value():
+    """Test repeated reads return the same count"""
+    counter = Counter()
+    for _ in range(3):
+        counter.inc()
+    
+    assert counter.value == 3
+    assert counter.value == 3
+    
+    counter.inc()
+    assert counter.value == 4
+
+
+def test_snapshot():
+    """Test snapshot reports every field"""
+    metrics = RequestMetrics()
+    metrics.total_requests.inc()
+    
+    snapshot = metrics.snapshot()
+    assert snapshot['total_requests'] == 1
+    assert set(snapshot) == set(RequestMetrics.FIELDS)
+
+
+if __name__ == '__main__':
+    test_counter_reads_do_not_change_value()
+    test_snapshot()
+    print("All tests passed!")
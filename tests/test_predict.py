@@ -0,0 +1,122 @@
+"""
+Predictor cache tests
+"""
+
+import sys
+sys.path.insert(0, '..')
+
+import asyncio
+import dataclasses
+import threading
+import time
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+xgb = pytest.importorskip('xgboost')
+
+import src.predict
+from src.batching import BatchScheduler
+from src.features import RAW_FEATURES, FEATURE_ORDER
+from src.predict import ChurnPredictor
+
+CUSTOMER = SimpleNamespace(**{name: 1.0 for name in RAW_FEATURES})
+
+
+@pytest.fixture
+def predictor(tmp_path, monkeypatch):
+    """Fresh predictor on a tiny booster, routed through a BatchScheduler"""
+    rng = np.random.default_rng(0)
+    X = rng.uniform(size=(200, len(FEATURE_ORDER))).astype(np.float32)
+    y = (X[:, 0] > 0.5).astype(np.float32)
+    dtrain = xgb.DMatrix(X, label=y, feature_names=list(FEATURE_ORDER))
+    booster = xgb.train({'objective': 'binary:logistic', 'nthread': 1}, dtrain, num_boost_round=5)
+
+    model_path = tmp_path / 'model.json'
+    booster.save_model(str(model_path))
+    monkeypatch.setattr(src.predict, 'config', dataclasses.replace(
+        src.predict.config,
+        MODEL_PATH=str(model_path),
+        USE_TREE_WALKER=False,
+        ONNX_MODEL_PATH='',
+        BATCH_TIMEOUT=1.0
+    ))
+
+    monkeypatch.setattr(ChurnPredictor, '_instance', None)
+    predictor = ChurnPredictor()
+    assert predictor.is_ready()
+
+    scheduler = BatchScheduler(predictor.predict_batch, max_wait_ms=1)
+    scheduler.start()
+    predictor.attach_scheduler(scheduler)
+    return predictor
+
+
+def _count_calls(predictor, fail=0, release=None):
+    """Wrap the model entry point, optionally failing or blocking first"""
+    calls = []
+    predict_proba = predictor._predict_proba
+
+    def wrapped(arr):
+        calls.append(len(arr))
+        if release is not None:
+            release.wait(2)
+        if len(calls) <= fail:
+            raise RuntimeError("model failed")
+        return predict_proba(arr)
+
+    predictor._predict_proba = wrapped
+    return calls
+
+
+def test_identical_inputs_hit_cache(predictor):
+    """Test repeated inputs share one model call"""
+    calls = _count_calls(predictor)
+
+    first = predictor.predict(CUSTOMER)
+    second = predictor.predict(SimpleNamespace(**{name: 1.0001 for name in RAW_FEATURES}))
+
+    assert first == second
+    assert calls == [1]
+    assert predictor._cache.cache_info().hits == 1
+
+
+def test_failed_batch_is_retried(predictor):
+    """Test a failed prediction is evicted and scored again next time"""
+    calls = _count_calls(predictor, fail=1)
+
+    with pytest.raises(RuntimeError):
+        predictor.predict(CUSTOMER)
+
+    result = predictor.predict(CUSTOMER)
+
+    assert 0.0 <= result['churn_probability'] <= 1.0
+    assert calls == [1, 1]
+
+
+def test_async_timeout_keeps_shared_future(predictor, monkeypatch):
+    """Test one caller timing out does not cancel the cached future"""
+    release = threading.Event()
+    calls = _count_calls(predictor, release=release)
+    monkeypatch.setattr(src.predict, 'config', dataclasses.replace(
+        src.predict.config,
+        BATCH_TIMEOUT=0.05
+    ))
+
+    # Hold the worker on another customer so ours is still queued (and
+    # cancellable) when the caller gives up
+    blocker = predictor._lookup(SimpleNamespace(**{name: 2.0 for name in RAW_FEATURES}))
+    while not calls:
+        time.sleep(0.001)
+
+    future = predictor._lookup(CUSTOMER)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(predictor.predict_async(CUSTOMER))
+
+    assert not future.cancelled()
+    assert predictor._lookup(CUSTOMER) is future
+
+    release.set()
+    assert 0.0 <= blocker.result(timeout=2) <= 1.0
+    assert 0.0 <= future.result(timeout=2) <= 1.0
+    assert calls == [1, 1]
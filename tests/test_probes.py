@@ -0,0 +1,95 @@
+"""
+Probe server tests
+"""
+
+import sys
+sys.path.insert(0, '..')
+
+import dataclasses
+import json
+from types import SimpleNamespace
+from urllib.error import HTTPError
+from urllib.request import urlopen
+import src.api.probes
+from src.api.probes import start_probe_server
+from src.metrics import RequestMetrics
+
+
+def _probe_get(path, predictor=None, metrics=None):
+    """GET a path from a probe server on a free port"""
+    if metrics is None:
+        metrics = RequestMetrics()
+    
+    server = start_probe_server('127.0.0.1', 0, predictor, metrics)
+    try:
+        port = server.server_address[1]
+        return urlopen(f'http://127.0.0.1:{port}{path}')
+    except HTTPError as e:
+        return e
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _stub_predictor(ready):
+    """Stand-in exposing the one method the probes call"""
+    return SimpleNamespace(is_ready=lambda: ready)
+
+
+def test_health():
+    """Test health endpoint"""
+    response = _probe_get('/health')
+    assert response.status == 200
+    assert json.loads(response.read())['status'] == 'healthy'
+
+
+def test_ready():
+    """Test ready endpoint with a loaded model"""
+    response = _probe_get('/ready', predictor=_stub_predictor(True))
+    assert response.status == 200
+    assert json.loads(response.read())['status'] == 'ready'
+
+
+def test_not_ready():
+    """Test ready endpoint without a model"""
+    assert _probe_get('/ready').status == 503
+    assert _probe_get('/ready', predictor=_stub_predictor(False)).status == 503
+
+
+def test_metrics():
+    """Test metrics endpoint reports this process's counters"""
+    metrics = RequestMetrics()
+    metrics.total_requests.inc()
+    
+    response = _probe_get('/metrics', metrics=metrics)
+    assert response.status == 200
+    assert json.loads(response.read())['total_requests'] == 1
+
+
+def test_metrics_disabled():
+    """Test metrics endpoint is refused when metrics are off"""
+    config = src.api.probes.config
+    src.api.probes.config = dataclasses.replace(config, ENABLE_METRICS=False)
+    try:
+        response = _probe_get('/metrics')
+    finally:
+        src.api.probes.config = config
+    
+    assert response.status == 403
+
+
+def test_unknown_path():
+    """Test unknown paths return 404"""
+    response = _probe_get('/missing')
+    assert response.status == 404
+    assert json.loads(response.read())['success'] == False
+
+
+if __name__ == '__main__':
+    test_health()
+    test_ready()
+    test_not_ready()
+    test_metrics()
+    test_metrics_disabled()
+    test_unknown_path()
+    print("All tests passed!")
@@ -0,0 +1,66 @@
+"""
+Compiled tree walker tests
+"""
+
+import sys
+sys.path.insert(0, '..')
+
+import numpy as np
+import pytest
+
+pytest.importorskip('numba')
+xgb = pytest.importorskip('xgboost')
+
+from src.tree_walker import CompiledTrees
+
+
+def _train_booster(n_features=8, seed=0):
+    """Train a small binary:logistic booster on data with missing values"""
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(500, n_features)).astype(np.float32)
+    y = (X[:, 0] + X[:, 1] * X[:, 2] > 0).astype(np.float32)
+    X[rng.uniform(size=X.shape) < 0.1] = np.nan
+
+    params = {
+        'objective': 'binary:logistic',
+        'max_depth': 4,
+        'eta': 0.3,
+        'nthread': 1,
+        'seed': seed,
+    }
+    return xgb.train(params, xgb.DMatrix(X, label=y), num_boost_round=20)
+
+
+def test_matches_inplace_predict():
+    """Test walker probabilities match XGBoost on random rows with NaN"""
+    booster = _train_booster()
+    walker = CompiledTrees(booster)
+
+    rng = np.random.default_rng(1)
+    rows = rng.normal(size=(200, 8)).astype(np.float32)
+    rows[rng.uniform(size=rows.shape) < 0.2] = np.nan
+
+    actual = np.concatenate([walker.predict(rows[i:i + 1]) for i in range(len(rows))])
+    expected = booster.inplace_predict(rows)
+
+    np.testing.assert_allclose(actual, expected, atol=1e-5)
+
+
+def test_rejects_other_objectives():
+    """Test non-logistic boosters are refused"""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(50, 4)).astype(np.float32)
+    booster = xgb.train(
+        {'objective': 'reg:squarederror', 'nthread': 1},
+        xgb.DMatrix(X, label=X[:, 0]),
+        num_boost_round=2
+    )
+
+    with pytest.raises(ValueError):
+        CompiledTrees(booster)
+
+
+if __name__ == '__main__':
+    test_matches_inplace_predict()
+    test_rejects_other_objectives()
+    print("All tests passed!")